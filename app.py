@@ -1,13 +1,23 @@
 import os
 import time
+import torch
 from transformers import BartTokenizer, BartForConditionalGeneration
 import streamlit as st
 
-# Load the BART model and tokenizer
+# Inference only; never build autograd graphs
+torch.set_grad_enabled(False)
+
+MODEL_NAME = 'sshleifer/distilbart-cnn-12-6'
+DEVICE = "cuda" if torch.cuda.is_available() else "cpu"
+
+# Load the BART model and tokenizer (FP16 on GPU, FP32 on CPU)
 @st.cache_resource
 def load_model():
-    tokenizer = BartTokenizer.from_pretrained('facebook/bart-large-cnn')
-    model = BartForConditionalGeneration.from_pretrained('facebook/bart-large-cnn')
+    tokenizer = BartTokenizer.from_pretrained(MODEL_NAME)
+    dtype = torch.float16 if DEVICE == "cuda" else torch.float32
+    model = BartForConditionalGeneration.from_pretrained(MODEL_NAME, torch_dtype=dtype)
+    model.to(DEVICE)
+    model.eval()
     return tokenizer, model
 
 # Read documents
@@ -21,23 +31,46 @@ def load_documents(folder_path="documents"):
 
 # Ask question using BART
 def ask_bart(query, documents):
-    tokenizer, model = load_model()
+    # Nothing to answer from; skip generation entirely
+    if not any(content.strip() for _, content in documents):
+        return ""
+
     context = "\n\n".join([f"{name}:\n{content}" for name, content in documents])
-    full_input = f"question: {query} context: {context[:1024]}"  # Truncate context if too long
+    full_input = f"question: {query} context: {context}"
 
-    inputs = tokenizer([full_input], max_length=1024, return_tensors='pt', truncation=True)
-    summary_ids = model.generate(inputs['input_ids'], num_beams=4, max_length=200, early_stopping=True)
-    output = tokenizer.decode(summary_ids[0], skip_special_tokens=True)
+    # Truncate by tokens (BART's limit is 1024 tokens, not characters)
+    inputs = TOKENIZER([full_input], max_length=1024, return_tensors='pt', truncation=True).to(DEVICE)
+    with torch.inference_mode():
+        summary_ids = MODEL.generate(inputs['input_ids'], num_beams=4, max_length=200, early_stopping=True)
+    output = TOKENIZER.decode(summary_ids[0], skip_special_tokens=True)
     return output
 
+# Cached answers per query + documents for 5 minutes
+@st.cache_data(ttl=300, max_entries=128, show_spinner=False)
+def ask_bart_cached(query, documents):
+    return ask_bart(query, documents)
+
+# Load model and documents once per session; Streamlit reruns this script on every interaction
+if "model" not in st.session_state:
+    st.session_state.model = load_model()
+if "documents" not in st.session_state:
+    st.session_state.documents = load_documents()
+TOKENIZER, MODEL = st.session_state.model
+
 # Streamlit UI
 st.title("📚 Smart Doc Assistant (BART Version)")
+if st.button("Reload documents"):
+    st.session_state.documents = load_documents()
+DOCUMENTS = st.session_state.documents
 query = st.text_input("Ask your question from the documents:")
+no_cache = st.checkbox("Bypass cache")
 
 if query:
     with st.spinner("Thinking..."):
-        documents = load_documents()
-        answer = ask_bart(query, documents)
-        if answer:
+        query = " ".join(query.split())
+        answer = ask_bart(query, DOCUMENTS) if no_cache else ask_bart_cached(query, DOCUMENTS)
+        if not any(content.strip() for _, content in DOCUMENTS):
+            st.warning("No document text to answer from")
+        elif answer:
             st.success("Answer:")
             st.write(answer)